@@ -122,6 +122,10 @@ class PackageManager():
         :returns: List of all packages matching `name`
         :rtype: ``list``
         """
+        # most callers pass a literal package name, which can be resolved
+        # with a single dict lookup instead of globbing every package
+        if not any(c in name for c in '*?['):
+            return [name] if name in self.packages else []
         return fnmatch.filter(self.packages.keys(), name)
 
     def all_pkgs_by_name_regex(self, regex_name, flags=0):
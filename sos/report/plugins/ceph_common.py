@@ -6,9 +6,79 @@
 #
 # See the LICENSE file in the source distribution for further information.
 import json
+import re
 from socket import gethostname
 from sos.report.plugins import Plugin, RedHatPlugin, UbuntuPlugin
 
+PROTECT_KEYS = (
+    "rgw keystone admin password",
+)
+_PROTECT_KEYS_RE = re.compile(
+    r'(^(' + '|'.join(map(re.escape, PROTECT_KEYS)) + r')\s*=\s*)(.*)',
+    re.MULTILINE
+)
+
+MICROCEPH_CMDS = (
+    'client config list',
+    'cluster config list',
+    'cluster list',
+    'disk list',
+    'log get-level',
+    'status',
+    'pool list',
+    'remote list',
+    'replication list rbd',
+)
+
+_DQLITE_QUERIES = (
+    {
+        "query": (
+            "SELECT * FROM sqlite_master WHERE type=\"table\";"
+        ),
+        "suggested_file_suffix": "schema",
+    },
+    {
+        "query": (
+            "SELECT * FROM config WHERE NOT ( "
+            "key LIKE \"%keyring%\" OR "
+            "key LIKE \"%ca_cert%\" OR "
+            "key LIKE \"%ca_key%\" );"
+        ),
+        "suggested_file_suffix": "config",
+    },
+    {
+        "query": "SELECT * FROM services;",
+        "suggested_file_suffix": "services",
+    },
+    {
+        "query": (
+            "SELECT id, name, expiry_date "
+            "FROM core_token_records;"
+        ),
+        "suggested_file_suffix": "token_records",
+    },
+    {
+        "query": (
+            "SELECT id, name, address, schema_internal, "
+            "schema_external, heartbeat, role, api_extensions "
+            "FROM core_cluster_members;"
+        ),
+        "suggested_file_suffix": "core_cluster_members",
+    },
+    {
+        "query": "SELECT * FROM disks;",
+        "suggested_file_suffix": "disks",
+    },
+    {
+        "query": "SELECT * FROM client_config;",
+        "suggested_file_suffix": "client_config",
+    },
+    {
+        "query": "SELECT * FROM remote;",
+        "suggested_file_suffix": "remote",
+    },
+)
+
 
 class CephCommon(Plugin, RedHatPlugin, UbuntuPlugin):
 
@@ -18,7 +88,6 @@ class CephCommon(Plugin, RedHatPlugin, UbuntuPlugin):
     profiles = ('storage', 'virt', 'container', 'ceph')
 
     containers = ('ceph-(.*-)?(mon|rgw|osd).*',)
-    ceph_hostname = gethostname()
 
     packages = (
         'ceph',
@@ -31,9 +100,6 @@ class CephCommon(Plugin, RedHatPlugin, UbuntuPlugin):
 
     services = (
         'ceph-nfs@pacemaker',
-        f'ceph-mds@{ceph_hostname}',
-        f'ceph-mon@{ceph_hostname}',
-        f'ceph-mgr@{ceph_hostname}',
         'ceph-radosgw@*',
         'ceph-osd@*'
     )
@@ -45,6 +111,16 @@ class CephCommon(Plugin, RedHatPlugin, UbuntuPlugin):
 
     def setup(self):
         all_logs = self.get_option("all_logs")
+        log_glob = "*" if all_logs else ""
+
+        # The mds, mon and mgr units are instantiated with the local hostname
+        # so they can't be listed in services without resolving it at import
+        ceph_hostname = gethostname()
+        for daemon in ('mds', 'mon', 'mgr'):
+            service = f"ceph-{daemon}@{ceph_hostname}"
+            if self.is_service(service):
+                self.add_service_status(service)
+                self.add_journal(service)
 
         microceph_pkg = self.policy.package_manager.pkg_by_name('microceph')
         if not microceph_pkg:
@@ -53,20 +129,10 @@ class CephCommon(Plugin, RedHatPlugin, UbuntuPlugin):
                 '/var/log/ceph(.*)?/ceph.log.*': 'ceph_log',
             })
 
-            if not all_logs:
-                self.add_copy_spec([
-                    "/var/log/calamari/*.log",
-                    "/var/log/ceph/**/ceph.log",
-                    "/var/log/ceph/cephadm.log",
-                ])
-            else:
-                self.add_copy_spec([
-                    "/var/log/calamari",
-                    "/var/log/ceph/**/ceph.log*",
-                    "/var/log/ceph/cephadm.log*",
-                ])
-
             self.add_copy_spec([
+                "/var/log/calamari" if all_logs else "/var/log/calamari/*.log",
+                f"/var/log/ceph/**/ceph.log{log_glob}",
+                f"/var/log/ceph/cephadm.log{log_glob}",
                 "/var/log/ceph/**/ceph.audit.log*",
                 "/etc/ceph/",
                 "/etc/calamari/",
@@ -86,33 +152,11 @@ class CephCommon(Plugin, RedHatPlugin, UbuntuPlugin):
                 "/etc/ceph/*bindpass*"
             ])
         else:
-            if not all_logs:
-                self.add_copy_spec([
-                    "/var/snap/microceph/common/logs/ceph.log",
-                    "/var/snap/microceph/common/logs/ceph.audit.log",
-                ])
-            else:
-                self.add_copy_spec([
-                    "/var/snap/microceph/common/logs/ceph.log*",
-                    "/var/snap/microceph/common/logs/ceph.audit.log*",
-                ])
-
             self.add_cmd_output("snap info microceph", subdir="microceph")
 
-            cmds = [
-                'client config list',
-                'cluster config list',
-                'cluster list',
-                'disk list',
-                'log get-level',
-                'status',
-                'pool list',
-                'remote list',
-                'replication list rbd',
-            ]
-
-            self.add_cmd_output([f"microceph {cmd}" for cmd in cmds],
-                                subdir='microceph')
+            self.add_cmd_output([
+                f"microceph {cmd}" for cmd in MICROCEPH_CMDS
+            ], subdir='microceph')
 
             dqlite_crt = "/var/snap/microceph/common/state/cluster.crt"
             self.add_cmd_output(
@@ -130,61 +174,14 @@ class CephCommon(Plugin, RedHatPlugin, UbuntuPlugin):
             )
 
             self.add_copy_spec([
-                    f"{db_path}/info.yaml",
-                    f"{db_path}/cluster.yaml",
-                    f"{db_path}/../daemon.yaml",
+                f"/var/snap/microceph/common/logs/ceph.log{log_glob}",
+                f"/var/snap/microceph/common/logs/ceph.audit.log{log_glob}",
+                f"{db_path}/info.yaml",
+                f"{db_path}/cluster.yaml",
+                f"{db_path}/../daemon.yaml",
             ])
 
-            queries = [
-                {
-                    "query": (
-                        "SELECT * FROM sqlite_master WHERE type=\"table\";"
-                    ),
-                    "suggested_file_suffix": "schema",
-                },
-                {
-                    "query": (
-                        "SELECT * FROM config WHERE NOT ( "
-                        "key LIKE \"%keyring%\" OR "
-                        "key LIKE \"%ca_cert%\" OR "
-                        "key LIKE \"%ca_key%\" );"
-                    ),
-                    "suggested_file_suffix": "config",
-                },
-                {
-                    "query": "SELECT * FROM services;",
-                    "suggested_file_suffix": "services",
-                },
-                {
-                    "query": (
-                        "SELECT id, name, expiry_date "
-                        "FROM core_token_records;"
-                    ),
-                    "suggested_file_suffix": "token_records",
-                },
-                {
-                    "query": (
-                        "SELECT id, name, address, schema_internal, "
-                        "schema_external, heartbeat, role, api_extensions "
-                        "FROM core_cluster_members;"
-                    ),
-                    "suggested_file_suffix": "core_cluster_members",
-                },
-                {
-                    "query": "SELECT * FROM disks;",
-                    "suggested_file_suffix": "disks",
-                },
-                {
-                    "query": "SELECT * FROM client_config;",
-                    "suggested_file_suffix": "client_config",
-                },
-                {
-                    "query": "SELECT * FROM remote;",
-                    "suggested_file_suffix": "remote",
-                },
-            ]
-
-            for query_entry in queries:
+            for query_entry in _DQLITE_QUERIES:
                 query = json.dumps(query_entry.get("query"))
                 file_suffix = query_entry.get("suggested_file_suffix")
                 self.add_cmd_output(
@@ -198,10 +195,7 @@ class CephCommon(Plugin, RedHatPlugin, UbuntuPlugin):
         ])
 
     def postproc(self):
-        protect_keys = [
-            "rgw keystone admin password",
-        ]
-        regex = fr"(^({'|'.join(protect_keys)})\s*=\s*)(.*)"
-        self.do_path_regex_sub("/etc/ceph/ceph.conf", regex, r"\1*********")
+        self.do_path_regex_sub("/etc/ceph/ceph.conf", _PROTECT_KEYS_RE,
+                               r"\1*********")
 
 # vim: set et ts=4 sw=4 :
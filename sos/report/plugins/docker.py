@@ -8,10 +8,36 @@
 #
 # See the LICENSE file in the source distribution for further information.
 
+import re
 from sos.report.plugins import (Plugin, RedHatPlugin, UbuntuPlugin,
                                 SoSPredicate, CosPlugin, PluginOpt,
                                 DebianPlugin)
 
+DOCKER_SUBCMDS = (
+    'events --since 24h --until 1s',
+    'ps',
+    'stats --no-stream',
+    'version',
+    'volume ls'
+)
+
+# Second column of 'docker network ls' output, i.e. the network name
+_NETWORK_NAME_RE = re.compile(r'^\S+[ \t]+(\S+)', re.MULTILINE)
+
+# Attempts to match key=value pairs inside container inspect output
+# for potentially sensitive items like env vars that contain passwords.
+# Typically, these will be seen in env elements or similar, and look
+# like this:
+#             "Env": [
+#                "mypassword=supersecret",
+#                "container=oci"
+#             ],
+# This will mask values when the variable name looks like it may be
+# something worth obfuscating.
+_ENV_RE = re.compile(
+    r'(?P<var>(pass|key|secret|PASS|KEY|SECRET).*?)=(?P<value>.*?)"'
+)
+
 
 class Docker(Plugin, CosPlugin):
 
@@ -44,16 +70,7 @@ class Docker(Plugin, CosPlugin):
 
         self.set_cmd_predicate(SoSPredicate(self, services=["docker"]))
 
-        subcmds = [
-            'events --since 24h --until 1s',
-            'ps',
-            'stats --no-stream',
-            'version',
-            'volume ls'
-        ]
-
-        for subcmd in subcmds:
-            self.add_cmd_output(f"docker {subcmd}")
+        self.add_cmd_output([f"docker {subcmd}" for subcmd in DOCKER_SUBCMDS])
 
         self.add_cmd_output("docker info",
                             tags="docker_info")
@@ -70,9 +87,10 @@ class Docker(Plugin, CosPlugin):
         nets = self.collect_cmd_output('docker network ls')
 
         if nets['status'] == 0:
-            networks = [n.split()[1] for n in nets['output'].splitlines()[1:]]
-            for net in networks:
-                self.add_cmd_output(f"docker network inspect {net}")
+            networks = _NETWORK_NAME_RE.findall(nets['output'])[1:]
+            self.add_cmd_output([
+                f"docker network inspect {net}" for net in networks
+            ])
 
         containers = [
             c[0] for c in self.get_containers(runtime='docker',
@@ -81,44 +99,30 @@ class Docker(Plugin, CosPlugin):
         images = self.get_container_images(runtime='docker')
         volumes = self.get_container_volumes(runtime='docker')
 
-        for container in containers:
-            self.add_cmd_output(f"docker inspect {container}",
-                                subdir='containers')
-            if self.get_option('logs'):
-                self.add_cmd_output(f"docker logs -t {container}",
-                                    subdir='containers')
-
-        for img in images:
-            name, img_id = img
-            insp = name if 'none' not in name else img_id
-            self.add_cmd_output(f"docker inspect {insp}", subdir='images',
-                                tags="docker_image_inspect")
-            self.add_cmd_output(
-                f"docker image history {insp}",
-                subdir='images/history',
-                tags='docker_image_tree'
-            )
-
-        for vol in volumes:
-            self.add_cmd_output(f"docker volume inspect {vol}",
-                                subdir='volumes')
+        self.add_cmd_output([
+            f"docker inspect {container}" for container in containers
+        ], subdir='containers')
+        if self.get_option('logs'):
+            self.add_cmd_output([
+                f"docker logs -t {container}" for container in containers
+            ], subdir='containers')
+
+        image_refs = [
+            name if 'none' not in name else img_id for name, img_id in images
+        ]
+        self.add_cmd_output([
+            f"docker inspect {insp}" for insp in image_refs
+        ], subdir='images', tags="docker_image_inspect")
+        self.add_cmd_output([
+            f"docker image history {insp}" for insp in image_refs
+        ], subdir='images/history', tags='docker_image_tree')
+
+        self.add_cmd_output([
+            f"docker volume inspect {vol}" for vol in volumes
+        ], subdir='volumes')
 
     def postproc(self):
-        # Attempts to match key=value pairs inside container inspect output
-        # for potentially sensitive items like env vars that contain passwords.
-        # Typically, these will be seen in env elements or similar, and look
-        # like this:
-        #             "Env": [
-        #                "mypassword=supersecret",
-        #                "container=oci"
-        #             ],
-        # This will mask values when the variable name looks like it may be
-        # something worth obfuscating.
-
-        env_regexp = r'(?P<var>(pass|key|secret|PASS|KEY|SECRET).*?)=' \
-                      '(?P<value>.*?)"'
-        self.do_cmd_output_sub('*inspect*', env_regexp,
-                               r'\g<var>=********"')
+        self.do_cmd_output_sub('*inspect*', _ENV_RE, r'\g<var>=********"')
 
 
 class RedHatDocker(Docker, RedHatPlugin):
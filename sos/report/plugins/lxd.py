@@ -11,6 +11,41 @@
 import json
 from sos.report.plugins import Plugin, UbuntuPlugin, SoSPredicate
 
+_DQLITE_QUERIES = (
+    {
+        "query": (
+            "SELECT * FROM sqlite_master WHERE type=\"table\";"
+        ),
+        "suggested_file_suffix": "schema",
+        "db": "local",
+    },
+    {
+        "query": (
+            "SELECT * FROM config WHERE NOT ( "
+            "key LIKE \"%keyring%\" OR "
+            "key LIKE \"%ca_cert%\" OR "
+            "key LIKE \"%ca_key%\" );"
+        ),
+        "suggested_file_suffix": "config",
+        "db": "local"
+    },
+    {
+        "query": "SELECT * FROM raft_nodes;",
+        "suggested_file_suffix": "raft_nodes",
+        "db": "local",
+    },
+    {
+        "query": "SELECT * FROM nodes;",
+        "suggested_file_suffix": "nodes",
+        "db": "global",
+    },
+    {
+        "query": "SELECT * FROM nodes_roles;",
+        "suggested_file_suffix": "nodes_roles",
+        "db": "global",
+    },
+)
+
 
 class LXD(Plugin, UbuntuPlugin):
 
@@ -74,42 +109,7 @@ class LXD(Plugin, UbuntuPlugin):
                 suggest_filename="ls_lxd_dqlite_dir",
             )
 
-            queries = [
-                {
-                    "query": (
-                        "SELECT * FROM sqlite_master WHERE type=\"table\";"
-                    ),
-                    "suggested_file_suffix": "schema",
-                    "db": "local",
-                },
-                {
-                    "query": (
-                        "SELECT * FROM config WHERE NOT ( "
-                        "key LIKE \"%keyring%\" OR "
-                        "key LIKE \"%ca_cert%\" OR "
-                        "key LIKE \"%ca_key%\" );"
-                    ),
-                    "suggested_file_suffix": "config",
-                    "db": "local"
-                },
-                {
-                    "query": "SELECT * FROM raft_nodes;",
-                    "suggested_file_suffix": "raft_nodes",
-                    "db": "local",
-                },
-                {
-                    "query": "SELECT * FROM nodes;",
-                    "suggested_file_suffix": "nodes",
-                    "db": "global",
-                },
-                {
-                    "query": "SELECT * FROM nodes_roles;",
-                    "suggested_file_suffix": "nodes_roles",
-                    "db": "global",
-                },
-            ]
-
-            for query_entry in queries:
+            for query_entry in _DQLITE_QUERIES:
                 db = query_entry.get("db", "local")
                 query = json.dumps(query_entry.get("query"))
                 file_suffix = query_entry.get("suggested_file_suffix")
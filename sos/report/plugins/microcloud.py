@@ -11,6 +11,28 @@
 import json
 from sos.report.plugins import Plugin, UbuntuPlugin
 
+_DQLITE_QUERIES = (
+    {
+        "query": "SELECT * FROM sqlite_master WHERE type=\"table\";",
+        "suggested_file_suffix": "schema",
+    },
+    {
+        "query": (
+            "SELECT id, name, expiry_date "
+            "FROM core_token_records;"
+        ),
+        "suggested_file_suffix": "token_records",
+    },
+    {
+        "query": (
+            "SELECT id, name, address, schema_internal, "
+            "schema_external, heartbeat, role, api_extensions "
+            "FROM core_cluster_members;"
+        ),
+        "suggested_file_suffix": "core_cluster_members",
+    },
+)
+
 
 class MicroCloud(Plugin, UbuntuPlugin):
     """The MicroCloud plugin collects the current status of the microcloud
@@ -59,29 +81,7 @@ class MicroCloud(Plugin, UbuntuPlugin):
             f"{db_path}/../daemon.yaml",
         ])
 
-        queries = [
-            {
-                "query": "SELECT * FROM sqlite_master WHERE type=\"table\";",
-                "suggested_file_suffix": "schema",
-            },
-            {
-                "query": (
-                    "SELECT id, name, expiry_date "
-                    "FROM core_token_records;"
-                ),
-                "suggested_file_suffix": "token_records",
-            },
-            {
-                "query": (
-                    "SELECT id, name, address, schema_internal, "
-                    "schema_external, heartbeat, role, api_extensions "
-                    "FROM core_cluster_members;"
-                ),
-                "suggested_file_suffix": "core_cluster_members",
-            },
-        ]
-
-        for query_entry in queries:
+        for query_entry in _DQLITE_QUERIES:
             query = json.dumps(query_entry.get("query"))
             file_suffix = query_entry.get("suggested_file_suffix")
             self.add_cmd_output(
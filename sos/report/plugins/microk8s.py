@@ -10,9 +10,59 @@
 # See the LICENSE file in the source distribution for further information.
 
 import json
+import mmap
+import os
 import re
+from functools import lru_cache
 from sos.report.plugins import Plugin, UbuntuPlugin
 
+PROTECT_KEYS = (
+    "certificate-authority-data",
+    "client-certificate-data",
+    "client-key-data",
+    "token",
+)
+_CMD_OUTPUT_RE = re.compile(r'(certificate-authority-data:|token:)\s.*')
+_PROTECT_KEYS_RE = re.compile(
+    r'(^\s*(' + '|'.join(map(re.escape, PROTECT_KEYS)) + r')\s*:\s*)(.*)',
+    re.MULTILINE
+)
+_ADDRESS_RE = re.compile(rb'Address:\s*(\d{1,3}(?:\.\d{1,3}){3}:\d+)')
+
+_DQLITE_QUERIES = (
+    {
+        "query": ".cluster",
+        "suggested_file_suffix": ".cluster",
+    },
+    {
+        "query": ".cluster",
+        "opts": ["-f json",],
+        "suggested_file_suffix": ".cluster_-f_json",
+    },
+    {
+        "query": ".leader",
+        "suggested_file_suffix": ".leader",
+    },
+)
+
+
+@lru_cache(maxsize=1)
+def _read_microk8s_nodes(path):
+    """Return the node addresses listed in the dqlite cluster.yaml at
+    `path` as a tuple. The result is cached, so the file is only parsed
+    once per sos run.
+    """
+    with open(path, 'rb') as cluster_definition:
+        # mmap cannot map an empty file
+        if not os.fstat(cluster_definition.fileno()).st_size:
+            return ()
+        with mmap.mmap(cluster_definition.fileno(), 0,
+                       access=mmap.ACCESS_READ) as cluster:
+            return tuple(
+                match.group(1).decode()
+                for match in _ADDRESS_RE.finditer(cluster)
+            )
+
 
 class Microk8s(Plugin, UbuntuPlugin):
     """The Microk8s plugin collects the current status of the microk8s
@@ -42,81 +92,53 @@ class Microk8s(Plugin, UbuntuPlugin):
             'status',
             'version'
         ]
+        db_path = "/var/snap/microk8s/current/var/kubernetes/backend"
+        cert = f"{db_path}/cluster.crt"
+
         self.add_copy_spec([
             "/var/snap/microk8s/current/args/*",
             "/var/snap/microk8s/current/credentials/client.config",
+            f"{db_path}/info.yaml",
+            f"{db_path}/cluster.yaml",
+            f"{db_path}/failure-domain",
         ])
 
         self.add_cmd_output([
             f"{self.microk8s_cmd} {subcmd}" for subcmd in microk8s_subcmds
         ])
 
-        crt_dir = "/var/snap/microk8s/current/var/kubernetes/backend"
-        dqlite_crt = f"{crt_dir}/cluster.crt"
-
         self.add_cmd_output(
-            f"openssl x509 -in {dqlite_crt} -noout -dates",
+            f"openssl x509 -in {cert} -noout -dates",
         )
 
-        db_path = "/var/snap/microk8s/current/var/kubernetes/backend"
-
         # Check for inconsistent dqlite db intervals
         self.add_dir_listing(
             db_path,
             suggest_filename="ls_microk8s_dqlite_dir",
         )
 
-        self.add_copy_spec([
-            f"{db_path}/info.yaml",
-            f"{db_path}/cluster.yaml",
-            f"{db_path}/failure-domain",
-        ])
-
         dqlite_bin = "/snap/microk8s/current/bin/dqlite"
-        cert = f"{db_path}/cluster.crt"
         key = f"{db_path}/cluster.key"
         servers = f"{db_path}/cluster.yaml"
         dqlite_cmd = f"{dqlite_bin} -c {cert} -k {key} -s file://{servers} k8s"
 
-        queries = [
-            {
-                "query": ".cluster",
-                "suggested_file_suffix": ".cluster",
-            },
-            {
-                "query": ".cluster",
-                "opts": ["-f json",],
-                "suggested_file_suffix": ".cluster_-f_json",
-            },
-            {
-                "query": ".leader",
-                "suggested_file_suffix": ".leader",
-            },
-        ]
-
-        try:
-            with open(servers, 'r', encoding='utf-8') as cluster_definition:
-                cluster = cluster_definition.read()
-                nodes = re.findall(
-                    r'Address:\s*(\d+\.\d+\.\d+\.\d+:\d+)', cluster
-                )
+        queries = list(_DQLITE_QUERIES)
 
-                for node in nodes:
-                    queries.append({
-                        "query": f".describe {node}",
-                        "suggested_file_suffix": f".describe_{node}",
-                        "opts": ["-f json",],
-                    })
+        nodes = ()
+        if self.path_exists(servers):
+            try:
+                nodes = _read_microk8s_nodes(self.path_join(servers))
+            except Exception as e:
+                self.add_alert(f"Failed to parse {servers}: {e}")
 
-        except Exception as e:
-            self.add_alert(f"Failed to parse {servers}: {e}")
+        queries.extend({
+            "query": f".describe {node}",
+            "suggested_file_suffix": f".describe_{node}",
+            "opts": ["-f json",],
+        } for node in nodes)
 
         for query_entry in queries:
-            sql_cmd = dqlite_cmd
-            opts = query_entry.get("opts", [])
-            for opt in opts:
-                sql_cmd = f"{sql_cmd} {opt}"
-
+            sql_cmd = " ".join([dqlite_cmd, *query_entry.get("opts", [])])
             query = json.dumps(query_entry.get("query"))
             file_suffix = query_entry.get("suggested_file_suffix")
             self.add_cmd_output(
@@ -125,21 +147,12 @@ class Microk8s(Plugin, UbuntuPlugin):
             )
 
     def postproc(self):
-        rsub = r'(certificate-authority-data:|token:)\s.*'
-        self.do_cmd_output_sub(self.microk8s_cmd, rsub, r'\1 "**********"')
-
-        protect_keys = [
-            "certificate-authority-data",
-            "client-certificate-data",
-            "client-key-data",
-            "token",
-        ]
-
-        key_regex = fr'(^\s*({"|".join(protect_keys)})\s*:\s*)(.*)'
+        self.do_cmd_output_sub(self.microk8s_cmd, _CMD_OUTPUT_RE,
+                               r'\1 "**********"')
 
         self.do_path_regex_sub(
             "/var/snap/microk8s/current/credentials/client.config",
-            key_regex, r"\1*********"
+            _PROTECT_KEYS_RE, r"\1*********"
         )
 
 # vim: set et ts=4 sw=4
@@ -11,6 +11,41 @@
 import json
 from sos.report.plugins import Plugin, UbuntuPlugin
 
+_DQLITE_QUERIES = (
+    {
+        "query": "SELECT * FROM sqlite_master WHERE type=\"table\";",
+        "suggested_file_suffix": "schema",
+    },
+    {
+        "query": (
+            "SELECT * FROM config WHERE NOT ( "
+            "key LIKE \"%keyring%\" OR "
+            "key LIKE \"%ca_cert%\" OR "
+            "key LIKE \"%ca_key%\" );"
+        ),
+        "suggested_file_suffix": "config",
+    },
+    {
+        "query": "SELECT * FROM services;",
+        "suggested_file_suffix": "services",
+    },
+    {
+        "query": (
+            "SELECT id, name, expiry_date "
+            "FROM core_token_records;"
+        ),
+        "suggested_file_suffix": "token_records",
+    },
+    {
+        "query": (
+            "SELECT id, name, address, schema_internal, "
+            "schema_external, heartbeat, role, api_extensions "
+            "FROM core_cluster_members;"
+        ),
+        "suggested_file_suffix": "core_cluster_members",
+    },
+)
+
 
 class MicroOVN(Plugin, UbuntuPlugin):
     """The MicroOVN plugin collects the current status of the microovn
@@ -64,42 +99,7 @@ class MicroOVN(Plugin, UbuntuPlugin):
         if self.get_option('all_logs'):
             self.add_copy_spec(f"{log_path}/*.log.*")
 
-        queries = [
-            {
-                "query": "SELECT * FROM sqlite_master WHERE type=\"table\";",
-                "suggested_file_suffix": "schema",
-            },
-            {
-                "query": (
-                    "SELECT * FROM config WHERE NOT ( "
-                    "key LIKE \"%keyring%\" OR "
-                    "key LIKE \"%ca_cert%\" OR "
-                    "key LIKE \"%ca_key%\" );"
-                ),
-                "suggested_file_suffix": "config",
-            },
-            {
-                "query": "SELECT * FROM services;",
-                "suggested_file_suffix": "services",
-            },
-            {
-                "query": (
-                    "SELECT id, name, expiry_date "
-                    "FROM core_token_records;"
-                ),
-                "suggested_file_suffix": "token_records",
-            },
-            {
-                "query": (
-                    "SELECT id, name, address, schema_internal, "
-                    "schema_external, heartbeat, role, api_extensions "
-                    "FROM core_cluster_members;"
-                ),
-                "suggested_file_suffix": "core_cluster_members",
-            },
-        ]
-
-        for query_entry in queries:
+        for query_entry in _DQLITE_QUERIES:
             query = json.dumps(query_entry.get("query"))
             file_suffix = query_entry.get("suggested_file_suffix")
             self.add_cmd_output(
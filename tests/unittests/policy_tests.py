@@ -111,6 +111,13 @@ class PackageManagerTests(unittest.TestCase):
     def test_default_pkg_by_name(self):
         self.assertEqual(self.pm.pkg_by_name('foo'), None)
 
+    def test_all_pkgs_by_name_literal_and_glob(self):
+        self.pm._packages = {'microceph': {}, 'microk8s': {}, 'lxd': {}}
+        self.assertEqual(self.pm.all_pkgs_by_name('lxd'), ['lxd'])
+        self.assertEqual(self.pm.all_pkgs_by_name('micro'), [])
+        self.assertEqual(sorted(self.pm.all_pkgs_by_name('micro*')),
+                         ['microceph', 'microk8s'])
+
 
 class RpmPackageManagerTests(unittest.TestCase):
 